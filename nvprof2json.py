@@ -1,8 +1,5 @@
 import sqlite3
 import argparse
-import enum
-import json
-import subprocess
 import os
 import sys
 import copy
@@ -21,6 +18,10 @@ def main():
 
     traceEvents = []
 
+    # cbid -> event name, resolved once per distinct cbid
+    cbid_names = {}
+    unknown_cbids = []
+
     """
     _id_: 11625
     cbid: 17
@@ -33,11 +34,14 @@ def main():
     """
     for row in conn.execute("SELECT * FROM CUPTI_ACTIVITY_KIND_RUNTIME"):
         #eprintRow(row)
-        try:
-            cbid = Cbids(row["cbid"]).name
-        except ValueError:
-            cbid = str(row["cbid"])
-            eprint("Unrecognized cbid {}".format(cbid))
+        cbid = cbid_names.get(row["cbid"])
+        if cbid is None:
+            if 0 <= row["cbid"] < len(CBID_NAMES):
+                cbid = CBID_NAMES[row["cbid"]]
+            else:
+                cbid = str(row["cbid"])
+                unknown_cbids.append(cbid)
+            cbid_names[row["cbid"]] = cbid
         event = {
                 "name": cbid,
                 "ph": "X", # Complete Event (Begin + End event)
@@ -52,6 +56,9 @@ def main():
                 }
         traceEvents.append(event)
 
+    if unknown_cbids:
+        eprint("Unrecognized cbids: {}".format(", ".join(unknown_cbids)))
+
     # TODO DRIVER
 
     """
@@ -211,7 +218,7 @@ def main():
         traceEvents.append(event)
         traceEvents.append(alt_event)
 
-
+    import json
     json.dump(traceEvents, sys.stdout)
     print()
 
@@ -224,6 +231,7 @@ def demangle(name):
     """Demangle a C++ identifier using c++filt"""
     # TODO: create the process only once.
     # Fortunately, this doesn't seem to be a bottleneck ATM.
+    import subprocess
     try:
         with open(os.devnull, 'w') as devnull:
             return subprocess.check_output(['c++filt', '-n', name], stderr=devnull).rstrip().decode("ascii")
@@ -231,345 +239,348 @@ def demangle(name):
         return name
 
 
-class Cbids(enum.IntEnum):
-    INVALID = 0
-    cudaDriverGetVersion = 1
-    cudaRuntimeGetVersion = 2
-    cudaGetDeviceCount = 3
-    cudaGetDeviceProperties = 4
-    cudaChooseDevice = 5
-    cudaGetChannelDesc = 6
-    cudaCreateChannelDesc = 7
-    cudaConfigureCall = 8
-    cudaSetupArgument = 9
-    cudaGetLastError = 10
-    cudaPeekAtLastError = 11
-    cudaGetErrorString = 12
-    cudaLaunch = 13
-    cudaFuncSetCacheConfig = 14
-    cudaFuncGetAttributes = 15
-    cudaSetDevice = 16
-    cudaGetDevice = 17
-    cudaSetValidDevices = 18
-    cudaSetDeviceFlags = 19
-    cudaMalloc = 20
-    cudaMallocPitch = 21
-    cudaFree = 22
-    cudaMallocArray = 23
-    cudaFreeArray = 24
-    cudaMallocHost = 25
-    cudaFreeHost = 26
-    cudaHostAlloc = 27
-    cudaHostGetDevicePointer = 28
-    cudaHostGetFlags = 29
-    cudaMemGetInfo = 30
-    cudaMemcpy = 31
-    cudaMemcpy2D = 32
-    cudaMemcpyToArray = 33
-    cudaMemcpy2DToArray = 34
-    cudaMemcpyFromArray = 35
-    cudaMemcpy2DFromArray = 36
-    cudaMemcpyArrayToArray = 37
-    cudaMemcpy2DArrayToArray = 38
-    cudaMemcpyToSymbol = 39
-    cudaMemcpyFromSymbol = 40
-    cudaMemcpyAsync = 41
-    cudaMemcpyToArrayAsync = 42
-    cudaMemcpyFromArrayAsync = 43
-    cudaMemcpy2DAsync = 44
-    cudaMemcpy2DToArrayAsync = 45
-    cudaMemcpy2DFromArrayAsync = 46
-    cudaMemcpyToSymbolAsync = 47
-    cudaMemcpyFromSymbolAsync = 48
-    cudaMemset = 49
-    cudaMemset2D = 50
-    cudaMemsetAsync = 51
-    cudaMemset2DAsync = 52
-    cudaGetSymbolAddress = 53
-    cudaGetSymbolSize = 54
-    cudaBindTexture = 55
-    cudaBindTexture2D = 56
-    cudaBindTextureToArray = 57
-    cudaUnbindTexture = 58
-    cudaGetTextureAlignmentOffset = 59
-    cudaGetTextureReference = 60
-    cudaBindSurfaceToArray = 61
-    cudaGetSurfaceReference = 62
-    cudaGLSetGLDevice = 63
-    cudaGLRegisterBufferObject = 64
-    cudaGLMapBufferObject = 65
-    cudaGLUnmapBufferObject = 66
-    cudaGLUnregisterBufferObject = 67
-    cudaGLSetBufferObjectMapFlags = 68
-    cudaGLMapBufferObjectAsync = 69
-    cudaGLUnmapBufferObjectAsync = 70
-    cudaWGLGetDevice = 71
-    cudaGraphicsGLRegisterImage = 72
-    cudaGraphicsGLRegisterBuffer = 73
-    cudaGraphicsUnregisterResource = 74
-    cudaGraphicsResourceSetMapFlags = 75
-    cudaGraphicsMapResources = 76
-    cudaGraphicsUnmapResources = 77
-    cudaGraphicsResourceGetMappedPointer = 78
-    cudaGraphicsSubResourceGetMappedArray = 79
-    cudaVDPAUGetDevice = 80
-    cudaVDPAUSetVDPAUDevice = 81
-    cudaGraphicsVDPAURegisterVideoSurface = 82
-    cudaGraphicsVDPAURegisterOutputSurface = 83
-    cudaD3D11GetDevice = 84
-    cudaD3D11GetDevices = 85
-    cudaD3D11SetDirect3DDevice = 86
-    cudaGraphicsD3D11RegisterResource = 87
-    cudaD3D10GetDevice = 88
-    cudaD3D10GetDevices = 89
-    cudaD3D10SetDirect3DDevice = 90
-    cudaGraphicsD3D10RegisterResource = 91
-    cudaD3D10RegisterResource = 92
-    cudaD3D10UnregisterResource = 93
-    cudaD3D10MapResources = 94
-    cudaD3D10UnmapResources = 95
-    cudaD3D10ResourceSetMapFlags = 96
-    cudaD3D10ResourceGetSurfaceDimensions = 97
-    cudaD3D10ResourceGetMappedArray = 98
-    cudaD3D10ResourceGetMappedPointer = 99
-    cudaD3D10ResourceGetMappedSize = 100
-    cudaD3D10ResourceGetMappedPitch = 101
-    cudaD3D9GetDevice = 102
-    cudaD3D9GetDevices = 103
-    cudaD3D9SetDirect3DDevice = 104
-    cudaD3D9GetDirect3DDevice = 105
-    cudaGraphicsD3D9RegisterResource = 106
-    cudaD3D9RegisterResource = 107
-    cudaD3D9UnregisterResource = 108
-    cudaD3D9MapResources = 109
-    cudaD3D9UnmapResources = 110
-    cudaD3D9ResourceSetMapFlags = 111
-    cudaD3D9ResourceGetSurfaceDimensions = 112
-    cudaD3D9ResourceGetMappedArray = 113
-    cudaD3D9ResourceGetMappedPointer = 114
-    cudaD3D9ResourceGetMappedSize = 115
-    cudaD3D9ResourceGetMappedPitch = 116
-    cudaD3D9Begin = 117
-    cudaD3D9End = 118
-    cudaD3D9RegisterVertexBuffer = 119
-    cudaD3D9UnregisterVertexBuffer = 120
-    cudaD3D9MapVertexBuffer = 121
-    cudaD3D9UnmapVertexBuffer = 122
-    cudaThreadExit = 123
-    cudaSetDoubleForDevice = 124
-    cudaSetDoubleForHost = 125
-    cudaThreadSynchronize = 126
-    cudaThreadGetLimit = 127
-    cudaThreadSetLimit = 128
-    cudaStreamCreate = 129
-    cudaStreamDestroy = 130
-    cudaStreamSynchronize = 131
-    cudaStreamQuery = 132
-    cudaEventCreate = 133
-    cudaEventCreateWithFlags = 134
-    cudaEventRecord = 135
-    cudaEventDestroy = 136
-    cudaEventSynchronize = 137
-    cudaEventQuery = 138
-    cudaEventElapsedTime = 139
-    cudaMalloc3D = 140
-    cudaMalloc3DArray = 141
-    cudaMemset3D = 142
-    cudaMemset3DAsync = 143
-    cudaMemcpy3D = 144
-    cudaMemcpy3DAsync = 145
-    cudaThreadSetCacheConfig = 146
-    cudaStreamWaitEvent = 147
-    cudaD3D11GetDirect3DDevice = 148
-    cudaD3D10GetDirect3DDevice = 149
-    cudaThreadGetCacheConfig = 150
-    cudaPointerGetAttributes = 151
-    cudaHostRegister = 152
-    cudaHostUnregister = 153
-    cudaDeviceCanAccessPeer = 154
-    cudaDeviceEnablePeerAccess = 155
-    cudaDeviceDisablePeerAccess = 156
-    cudaPeerRegister = 157
-    cudaPeerUnregister = 158
-    cudaPeerGetDevicePointer = 159
-    cudaMemcpyPeer = 160
-    cudaMemcpyPeerAsync = 161
-    cudaMemcpy3DPeer = 162
-    cudaMemcpy3DPeerAsync = 163
-    cudaDeviceReset = 164
-    cudaDeviceSynchronize = 165
-    cudaDeviceGetLimit = 166
-    cudaDeviceSetLimit = 167
-    cudaDeviceGetCacheConfig = 168
-    cudaDeviceSetCacheConfig = 169
-    cudaProfilerInitialize = 170
-    cudaProfilerStart = 171
-    cudaProfilerStop = 172
-    cudaDeviceGetByPCIBusId = 173
-    cudaDeviceGetPCIBusId = 174
-    cudaGLGetDevices = 175
-    cudaIpcGetEventHandle = 176
-    cudaIpcOpenEventHandle = 177
-    cudaIpcGetMemHandle = 178
-    cudaIpcOpenMemHandle = 179
-    cudaIpcCloseMemHandle = 180
-    cudaArrayGetInfo = 181
-    cudaFuncSetSharedMemConfig = 182
-    cudaDeviceGetSharedMemConfig = 183
-    cudaDeviceSetSharedMemConfig = 184
-    cudaCreateTextureObject = 185
-    cudaDestroyTextureObject = 186
-    cudaGetTextureObjectResourceDesc = 187
-    cudaGetTextureObjectTextureDesc = 188
-    cudaCreateSurfaceObject = 189
-    cudaDestroySurfaceObject = 190
-    cudaGetSurfaceObjectResourceDesc = 191
-    cudaMallocMipmappedArray = 192
-    cudaGetMipmappedArrayLevel = 193
-    cudaFreeMipmappedArray = 194
-    cudaBindTextureToMipmappedArray = 195
-    cudaGraphicsResourceGetMappedMipmappedArray = 196
-    cudaStreamAddCallback = 197
-    cudaStreamCreateWithFlags = 198
-    cudaGetTextureObjectResourceViewDesc = 199
-    cudaDeviceGetAttribute = 200
-    cudaStreamDestroy_v5050 = 201
-    cudaStreamCreateWithPriority = 202
-    cudaStreamGetPriority = 203
-    cudaStreamGetFlags = 204
-    cudaDeviceGetStreamPriorityRange = 205
-    cudaMallocManaged = 206
-    cudaOccupancyMaxActiveBlocksPerMultiprocessor_v6000 = 207
-    cudaStreamAttachMemAsync = 208
-    cudaGetErrorName = 209
-    cudaOccupancyMaxActiveBlocksPerMultiprocessor_v6050 = 210
-    cudaLaunchKernel = 211
-    cudaGetDeviceFlags = 212
-    cudaLaunch_ptsz = 213
-    cudaLaunchKernel_ptsz = 214
-    cudaMemcpy_ptds = 215
-    cudaMemcpy2D_ptds = 216
-    cudaMemcpyToArray_ptds = 217
-    cudaMemcpy2DToArray_ptds = 218
-    cudaMemcpyFromArray_ptds = 219
-    cudaMemcpy2DFromArray_ptds = 220
-    cudaMemcpyArrayToArray_ptds = 221
-    cudaMemcpy2DArrayToArray_ptds = 222
-    cudaMemcpyToSymbol_ptds = 223
-    cudaMemcpyFromSymbol_ptds = 224
-    cudaMemcpyAsync_ptsz = 225
-    cudaMemcpyToArrayAsync_ptsz = 226
-    cudaMemcpyFromArrayAsync_ptsz = 227
-    cudaMemcpy2DAsync_ptsz = 228
-    cudaMemcpy2DToArrayAsync_ptsz = 229
-    cudaMemcpy2DFromArrayAsync_ptsz = 230
-    cudaMemcpyToSymbolAsync_ptsz = 231
-    cudaMemcpyFromSymbolAsync_ptsz = 232
-    cudaMemset_ptds = 233
-    cudaMemset2D_ptds = 234
-    cudaMemsetAsync_ptsz = 235
-    cudaMemset2DAsync_ptsz = 236
-    cudaStreamGetPriority_ptsz = 237
-    cudaStreamGetFlags_ptsz = 238
-    cudaStreamSynchronize_ptsz = 239
-    cudaStreamQuery_ptsz = 240
-    cudaStreamAttachMemAsync_ptsz = 241
-    cudaEventRecord_ptsz = 242
-    cudaMemset3D_ptds = 243
-    cudaMemset3DAsync_ptsz = 244
-    cudaMemcpy3D_ptds = 245
-    cudaMemcpy3DAsync_ptsz = 246
-    cudaStreamWaitEvent_ptsz = 247
-    cudaStreamAddCallback_ptsz = 248
-    cudaMemcpy3DPeer_ptds = 249
-    cudaMemcpy3DPeerAsync_ptsz = 250
-    cudaOccupancyMaxActiveBlocksPerMultiprocessorWithFlags = 251
-    cudaMemPrefetchAsync = 252
-    cudaMemPrefetchAsync_ptsz = 253
-    cudaMemAdvise = 254
-    cudaDeviceGetP2PAttribute = 255
-    cudaGraphicsEGLRegisterImage = 256
-    cudaEGLStreamConsumerConnect = 257
-    cudaEGLStreamConsumerDisconnect = 258
-    cudaEGLStreamConsumerAcquireFrame = 259
-    cudaEGLStreamConsumerReleaseFrame = 260
-    cudaEGLStreamProducerConnect = 261
-    cudaEGLStreamProducerDisconnect = 262
-    cudaEGLStreamProducerPresentFrame = 263
-    cudaEGLStreamProducerReturnFrame = 264
-    cudaGraphicsResourceGetMappedEglFrame = 265
-    cudaMemRangeGetAttribute = 266
-    cudaMemRangeGetAttributes = 267
-    cudaEGLStreamConsumerConnectWithFlags = 268
-    cudaLaunchCooperativeKernel = 269
-    cudaLaunchCooperativeKernel_ptsz = 270
-    cudaEventCreateFromEGLSync = 271
-    cudaLaunchCooperativeKernelMultiDevice = 272
-    cudaFuncSetAttribute = 273
-    cudaImportExternalMemory = 274
-    cudaExternalMemoryGetMappedBuffer = 275
-    cudaExternalMemoryGetMappedMipmappedArray = 276
-    cudaDestroyExternalMemory = 277
-    cudaImportExternalSemaphore = 278
-    cudaSignalExternalSemaphoresAsync = 279
-    cudaSignalExternalSemaphoresAsync_ptsz = 280
-    cudaWaitExternalSemaphoresAsync = 281
-    cudaWaitExternalSemaphoresAsync_ptsz = 282
-    cudaDestroyExternalSemaphore = 283
-    cudaLaunchHostFunc = 284
-    cudaLaunchHostFunc_ptsz = 285
-    cudaGraphCreate = 286
-    cudaGraphKernelNodeGetParams = 287
-    cudaGraphKernelNodeSetParams = 288
-    cudaGraphAddKernelNode = 289
-    cudaGraphAddMemcpyNode = 290
-    cudaGraphMemcpyNodeGetParams = 291
-    cudaGraphMemcpyNodeSetParams = 292
-    cudaGraphAddMemsetNode = 293
-    cudaGraphMemsetNodeGetParams = 294
-    cudaGraphMemsetNodeSetParams = 295
-    cudaGraphAddHostNode = 296
-    cudaGraphHostNodeGetParams = 297
-    cudaGraphAddChildGraphNode = 298
-    cudaGraphChildGraphNodeGetGraph = 299
-    cudaGraphAddEmptyNode = 300
-    cudaGraphClone = 301
-    cudaGraphNodeFindInClone = 302
-    cudaGraphNodeGetType = 303
-    cudaGraphGetRootNodes = 304
-    cudaGraphNodeGetDependencies = 305
-    cudaGraphNodeGetDependentNodes = 306
-    cudaGraphAddDependencies = 307
-    cudaGraphRemoveDependencies = 308
-    cudaGraphDestroyNode = 309
-    cudaGraphInstantiate = 310
-    cudaGraphLaunch = 311
-    cudaGraphLaunch_ptsz = 312
-    cudaGraphExecDestroy = 313
-    cudaGraphDestroy = 314
-    cudaStreamBeginCapture = 315
-    cudaStreamBeginCapture_ptsz = 316
-    cudaStreamIsCapturing = 317
-    cudaStreamIsCapturing_ptsz = 318
-    cudaStreamEndCapture = 319
-    cudaStreamEndCapture_ptsz = 320
-    cudaGraphHostNodeSetParams = 321
-    cudaGraphGetNodes = 322
-    cudaGraphGetEdges = 323
-    cudaStreamGetCaptureInfo = 324
-    cudaStreamGetCaptureInfo_ptsz = 325
-    cudaGraphExecKernelNodeSetParams = 326
-    cudaThreadExchangeStreamCaptureMode = 327
-    cudaDeviceGetNvSciSyncAttributes = 328
-    cudaOccupancyAvailableDynamicSMemPerBlock = 329
-    cudaStreamSetFlags = 330
-    cudaStreamSetFlags_ptsz = 331
-    cudaGraphExecMemcpyNodeSetParams = 332
-    cudaGraphExecMemsetNodeSetParams = 333
-    cudaGraphExecHostNodeSetParams = 334
-    cudaGraphExecUpdate = 335
-    SIZE = 336
-    FORCE_INT = 0x7FFFFFFF
+# CUPTI runtime API callback ids (CUpti_runtime_api_trace_cbid), indexed by
+# cbid.  The ids are contiguous, so a flat tuple is enough; the trailing
+# FORCE_INT sentinel of the C enum is never recorded and is left out.
+CBID_NAMES = (
+    "INVALID",
+    "cudaDriverGetVersion",
+    "cudaRuntimeGetVersion",
+    "cudaGetDeviceCount",
+    "cudaGetDeviceProperties",
+    "cudaChooseDevice",
+    "cudaGetChannelDesc",
+    "cudaCreateChannelDesc",
+    "cudaConfigureCall",
+    "cudaSetupArgument",
+    "cudaGetLastError",
+    "cudaPeekAtLastError",
+    "cudaGetErrorString",
+    "cudaLaunch",
+    "cudaFuncSetCacheConfig",
+    "cudaFuncGetAttributes",
+    "cudaSetDevice",
+    "cudaGetDevice",
+    "cudaSetValidDevices",
+    "cudaSetDeviceFlags",
+    "cudaMalloc",
+    "cudaMallocPitch",
+    "cudaFree",
+    "cudaMallocArray",
+    "cudaFreeArray",
+    "cudaMallocHost",
+    "cudaFreeHost",
+    "cudaHostAlloc",
+    "cudaHostGetDevicePointer",
+    "cudaHostGetFlags",
+    "cudaMemGetInfo",
+    "cudaMemcpy",
+    "cudaMemcpy2D",
+    "cudaMemcpyToArray",
+    "cudaMemcpy2DToArray",
+    "cudaMemcpyFromArray",
+    "cudaMemcpy2DFromArray",
+    "cudaMemcpyArrayToArray",
+    "cudaMemcpy2DArrayToArray",
+    "cudaMemcpyToSymbol",
+    "cudaMemcpyFromSymbol",
+    "cudaMemcpyAsync",
+    "cudaMemcpyToArrayAsync",
+    "cudaMemcpyFromArrayAsync",
+    "cudaMemcpy2DAsync",
+    "cudaMemcpy2DToArrayAsync",
+    "cudaMemcpy2DFromArrayAsync",
+    "cudaMemcpyToSymbolAsync",
+    "cudaMemcpyFromSymbolAsync",
+    "cudaMemset",
+    "cudaMemset2D",
+    "cudaMemsetAsync",
+    "cudaMemset2DAsync",
+    "cudaGetSymbolAddress",
+    "cudaGetSymbolSize",
+    "cudaBindTexture",
+    "cudaBindTexture2D",
+    "cudaBindTextureToArray",
+    "cudaUnbindTexture",
+    "cudaGetTextureAlignmentOffset",
+    "cudaGetTextureReference",
+    "cudaBindSurfaceToArray",
+    "cudaGetSurfaceReference",
+    "cudaGLSetGLDevice",
+    "cudaGLRegisterBufferObject",
+    "cudaGLMapBufferObject",
+    "cudaGLUnmapBufferObject",
+    "cudaGLUnregisterBufferObject",
+    "cudaGLSetBufferObjectMapFlags",
+    "cudaGLMapBufferObjectAsync",
+    "cudaGLUnmapBufferObjectAsync",
+    "cudaWGLGetDevice",
+    "cudaGraphicsGLRegisterImage",
+    "cudaGraphicsGLRegisterBuffer",
+    "cudaGraphicsUnregisterResource",
+    "cudaGraphicsResourceSetMapFlags",
+    "cudaGraphicsMapResources",
+    "cudaGraphicsUnmapResources",
+    "cudaGraphicsResourceGetMappedPointer",
+    "cudaGraphicsSubResourceGetMappedArray",
+    "cudaVDPAUGetDevice",
+    "cudaVDPAUSetVDPAUDevice",
+    "cudaGraphicsVDPAURegisterVideoSurface",
+    "cudaGraphicsVDPAURegisterOutputSurface",
+    "cudaD3D11GetDevice",
+    "cudaD3D11GetDevices",
+    "cudaD3D11SetDirect3DDevice",
+    "cudaGraphicsD3D11RegisterResource",
+    "cudaD3D10GetDevice",
+    "cudaD3D10GetDevices",
+    "cudaD3D10SetDirect3DDevice",
+    "cudaGraphicsD3D10RegisterResource",
+    "cudaD3D10RegisterResource",
+    "cudaD3D10UnregisterResource",
+    "cudaD3D10MapResources",
+    "cudaD3D10UnmapResources",
+    "cudaD3D10ResourceSetMapFlags",
+    "cudaD3D10ResourceGetSurfaceDimensions",
+    "cudaD3D10ResourceGetMappedArray",
+    "cudaD3D10ResourceGetMappedPointer",
+    "cudaD3D10ResourceGetMappedSize",
+    "cudaD3D10ResourceGetMappedPitch",
+    "cudaD3D9GetDevice",
+    "cudaD3D9GetDevices",
+    "cudaD3D9SetDirect3DDevice",
+    "cudaD3D9GetDirect3DDevice",
+    "cudaGraphicsD3D9RegisterResource",
+    "cudaD3D9RegisterResource",
+    "cudaD3D9UnregisterResource",
+    "cudaD3D9MapResources",
+    "cudaD3D9UnmapResources",
+    "cudaD3D9ResourceSetMapFlags",
+    "cudaD3D9ResourceGetSurfaceDimensions",
+    "cudaD3D9ResourceGetMappedArray",
+    "cudaD3D9ResourceGetMappedPointer",
+    "cudaD3D9ResourceGetMappedSize",
+    "cudaD3D9ResourceGetMappedPitch",
+    "cudaD3D9Begin",
+    "cudaD3D9End",
+    "cudaD3D9RegisterVertexBuffer",
+    "cudaD3D9UnregisterVertexBuffer",
+    "cudaD3D9MapVertexBuffer",
+    "cudaD3D9UnmapVertexBuffer",
+    "cudaThreadExit",
+    "cudaSetDoubleForDevice",
+    "cudaSetDoubleForHost",
+    "cudaThreadSynchronize",
+    "cudaThreadGetLimit",
+    "cudaThreadSetLimit",
+    "cudaStreamCreate",
+    "cudaStreamDestroy",
+    "cudaStreamSynchronize",
+    "cudaStreamQuery",
+    "cudaEventCreate",
+    "cudaEventCreateWithFlags",
+    "cudaEventRecord",
+    "cudaEventDestroy",
+    "cudaEventSynchronize",
+    "cudaEventQuery",
+    "cudaEventElapsedTime",
+    "cudaMalloc3D",
+    "cudaMalloc3DArray",
+    "cudaMemset3D",
+    "cudaMemset3DAsync",
+    "cudaMemcpy3D",
+    "cudaMemcpy3DAsync",
+    "cudaThreadSetCacheConfig",
+    "cudaStreamWaitEvent",
+    "cudaD3D11GetDirect3DDevice",
+    "cudaD3D10GetDirect3DDevice",
+    "cudaThreadGetCacheConfig",
+    "cudaPointerGetAttributes",
+    "cudaHostRegister",
+    "cudaHostUnregister",
+    "cudaDeviceCanAccessPeer",
+    "cudaDeviceEnablePeerAccess",
+    "cudaDeviceDisablePeerAccess",
+    "cudaPeerRegister",
+    "cudaPeerUnregister",
+    "cudaPeerGetDevicePointer",
+    "cudaMemcpyPeer",
+    "cudaMemcpyPeerAsync",
+    "cudaMemcpy3DPeer",
+    "cudaMemcpy3DPeerAsync",
+    "cudaDeviceReset",
+    "cudaDeviceSynchronize",
+    "cudaDeviceGetLimit",
+    "cudaDeviceSetLimit",
+    "cudaDeviceGetCacheConfig",
+    "cudaDeviceSetCacheConfig",
+    "cudaProfilerInitialize",
+    "cudaProfilerStart",
+    "cudaProfilerStop",
+    "cudaDeviceGetByPCIBusId",
+    "cudaDeviceGetPCIBusId",
+    "cudaGLGetDevices",
+    "cudaIpcGetEventHandle",
+    "cudaIpcOpenEventHandle",
+    "cudaIpcGetMemHandle",
+    "cudaIpcOpenMemHandle",
+    "cudaIpcCloseMemHandle",
+    "cudaArrayGetInfo",
+    "cudaFuncSetSharedMemConfig",
+    "cudaDeviceGetSharedMemConfig",
+    "cudaDeviceSetSharedMemConfig",
+    "cudaCreateTextureObject",
+    "cudaDestroyTextureObject",
+    "cudaGetTextureObjectResourceDesc",
+    "cudaGetTextureObjectTextureDesc",
+    "cudaCreateSurfaceObject",
+    "cudaDestroySurfaceObject",
+    "cudaGetSurfaceObjectResourceDesc",
+    "cudaMallocMipmappedArray",
+    "cudaGetMipmappedArrayLevel",
+    "cudaFreeMipmappedArray",
+    "cudaBindTextureToMipmappedArray",
+    "cudaGraphicsResourceGetMappedMipmappedArray",
+    "cudaStreamAddCallback",
+    "cudaStreamCreateWithFlags",
+    "cudaGetTextureObjectResourceViewDesc",
+    "cudaDeviceGetAttribute",
+    "cudaStreamDestroy_v5050",
+    "cudaStreamCreateWithPriority",
+    "cudaStreamGetPriority",
+    "cudaStreamGetFlags",
+    "cudaDeviceGetStreamPriorityRange",
+    "cudaMallocManaged",
+    "cudaOccupancyMaxActiveBlocksPerMultiprocessor_v6000",
+    "cudaStreamAttachMemAsync",
+    "cudaGetErrorName",
+    "cudaOccupancyMaxActiveBlocksPerMultiprocessor_v6050",
+    "cudaLaunchKernel",
+    "cudaGetDeviceFlags",
+    "cudaLaunch_ptsz",
+    "cudaLaunchKernel_ptsz",
+    "cudaMemcpy_ptds",
+    "cudaMemcpy2D_ptds",
+    "cudaMemcpyToArray_ptds",
+    "cudaMemcpy2DToArray_ptds",
+    "cudaMemcpyFromArray_ptds",
+    "cudaMemcpy2DFromArray_ptds",
+    "cudaMemcpyArrayToArray_ptds",
+    "cudaMemcpy2DArrayToArray_ptds",
+    "cudaMemcpyToSymbol_ptds",
+    "cudaMemcpyFromSymbol_ptds",
+    "cudaMemcpyAsync_ptsz",
+    "cudaMemcpyToArrayAsync_ptsz",
+    "cudaMemcpyFromArrayAsync_ptsz",
+    "cudaMemcpy2DAsync_ptsz",
+    "cudaMemcpy2DToArrayAsync_ptsz",
+    "cudaMemcpy2DFromArrayAsync_ptsz",
+    "cudaMemcpyToSymbolAsync_ptsz",
+    "cudaMemcpyFromSymbolAsync_ptsz",
+    "cudaMemset_ptds",
+    "cudaMemset2D_ptds",
+    "cudaMemsetAsync_ptsz",
+    "cudaMemset2DAsync_ptsz",
+    "cudaStreamGetPriority_ptsz",
+    "cudaStreamGetFlags_ptsz",
+    "cudaStreamSynchronize_ptsz",
+    "cudaStreamQuery_ptsz",
+    "cudaStreamAttachMemAsync_ptsz",
+    "cudaEventRecord_ptsz",
+    "cudaMemset3D_ptds",
+    "cudaMemset3DAsync_ptsz",
+    "cudaMemcpy3D_ptds",
+    "cudaMemcpy3DAsync_ptsz",
+    "cudaStreamWaitEvent_ptsz",
+    "cudaStreamAddCallback_ptsz",
+    "cudaMemcpy3DPeer_ptds",
+    "cudaMemcpy3DPeerAsync_ptsz",
+    "cudaOccupancyMaxActiveBlocksPerMultiprocessorWithFlags",
+    "cudaMemPrefetchAsync",
+    "cudaMemPrefetchAsync_ptsz",
+    "cudaMemAdvise",
+    "cudaDeviceGetP2PAttribute",
+    "cudaGraphicsEGLRegisterImage",
+    "cudaEGLStreamConsumerConnect",
+    "cudaEGLStreamConsumerDisconnect",
+    "cudaEGLStreamConsumerAcquireFrame",
+    "cudaEGLStreamConsumerReleaseFrame",
+    "cudaEGLStreamProducerConnect",
+    "cudaEGLStreamProducerDisconnect",
+    "cudaEGLStreamProducerPresentFrame",
+    "cudaEGLStreamProducerReturnFrame",
+    "cudaGraphicsResourceGetMappedEglFrame",
+    "cudaMemRangeGetAttribute",
+    "cudaMemRangeGetAttributes",
+    "cudaEGLStreamConsumerConnectWithFlags",
+    "cudaLaunchCooperativeKernel",
+    "cudaLaunchCooperativeKernel_ptsz",
+    "cudaEventCreateFromEGLSync",
+    "cudaLaunchCooperativeKernelMultiDevice",
+    "cudaFuncSetAttribute",
+    "cudaImportExternalMemory",
+    "cudaExternalMemoryGetMappedBuffer",
+    "cudaExternalMemoryGetMappedMipmappedArray",
+    "cudaDestroyExternalMemory",
+    "cudaImportExternalSemaphore",
+    "cudaSignalExternalSemaphoresAsync",
+    "cudaSignalExternalSemaphoresAsync_ptsz",
+    "cudaWaitExternalSemaphoresAsync",
+    "cudaWaitExternalSemaphoresAsync_ptsz",
+    "cudaDestroyExternalSemaphore",
+    "cudaLaunchHostFunc",
+    "cudaLaunchHostFunc_ptsz",
+    "cudaGraphCreate",
+    "cudaGraphKernelNodeGetParams",
+    "cudaGraphKernelNodeSetParams",
+    "cudaGraphAddKernelNode",
+    "cudaGraphAddMemcpyNode",
+    "cudaGraphMemcpyNodeGetParams",
+    "cudaGraphMemcpyNodeSetParams",
+    "cudaGraphAddMemsetNode",
+    "cudaGraphMemsetNodeGetParams",
+    "cudaGraphMemsetNodeSetParams",
+    "cudaGraphAddHostNode",
+    "cudaGraphHostNodeGetParams",
+    "cudaGraphAddChildGraphNode",
+    "cudaGraphChildGraphNodeGetGraph",
+    "cudaGraphAddEmptyNode",
+    "cudaGraphClone",
+    "cudaGraphNodeFindInClone",
+    "cudaGraphNodeGetType",
+    "cudaGraphGetRootNodes",
+    "cudaGraphNodeGetDependencies",
+    "cudaGraphNodeGetDependentNodes",
+    "cudaGraphAddDependencies",
+    "cudaGraphRemoveDependencies",
+    "cudaGraphDestroyNode",
+    "cudaGraphInstantiate",
+    "cudaGraphLaunch",
+    "cudaGraphLaunch_ptsz",
+    "cudaGraphExecDestroy",
+    "cudaGraphDestroy",
+    "cudaStreamBeginCapture",
+    "cudaStreamBeginCapture_ptsz",
+    "cudaStreamIsCapturing",
+    "cudaStreamIsCapturing_ptsz",
+    "cudaStreamEndCapture",
+    "cudaStreamEndCapture_ptsz",
+    "cudaGraphHostNodeSetParams",
+    "cudaGraphGetNodes",
+    "cudaGraphGetEdges",
+    "cudaStreamGetCaptureInfo",
+    "cudaStreamGetCaptureInfo_ptsz",
+    "cudaGraphExecKernelNodeSetParams",
+    "cudaThreadExchangeStreamCaptureMode",
+    "cudaDeviceGetNvSciSyncAttributes",
+    "cudaOccupancyAvailableDynamicSMemPerBlock",
+    "cudaStreamSetFlags",
+    "cudaStreamSetFlags_ptsz",
+    "cudaGraphExecMemcpyNodeSetParams",
+    "cudaGraphExecMemsetNodeSetParams",
+    "cudaGraphExecHostNodeSetParams",
+    "cudaGraphExecUpdate",
+    "SIZE",
+)
 
 
 def sizeof_fmt(num, suffix='B'):
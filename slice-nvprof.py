@@ -1,29 +1,203 @@
 import sqlite3
 import argparse
-import shutil
+import os
 import sys
+import urllib.parse
 
 def main():
-    parser = argparse.ArgumentParser(description='Make modifications to nvprof output.')
+    parser = argparse.ArgumentParser(description='Extract a time window of nvprof output into a new, smaller profile.')
     parser.add_argument('filename')
-    parser.add_argument('--output', '-o', required=True, help="Output profile")
+    parser.add_argument('--output', '-o', required=True, help="Output profile (must not exist)")
+    parser.add_argument('--start', type=int, help="Keep data starting at or after this timestamp (ns)")
+    parser.add_argument('--end', type=int, help="Keep data starting at or before this timestamp (ns)")
+    parser.add_argument('--range', metavar='NAME', help="Keep data inside the NVTX range NAME")
+    parser.add_argument('--occurrence', type=int,
+                        help="Which occurrence of --range to keep, counting from 0 (default: 0)")
+    parser.add_argument('--iteration-marker', metavar='NAME',
+                        help="NVTX marker or range NAME marks the start of each iteration")
+    parser.add_argument('--iterations', metavar='FIRST[:LAST]', type=iteration_span,
+                        help="Iterations to keep with --iteration-marker, counting from 0, inclusive (default: 0)")
     args = parser.parse_args()
 
-    shutil.copyfile(args.filename, args.output)
-    conn = sqlite3.connect(args.output)
+    if args.range is not None and args.iteration_marker is not None:
+        parser.error("--range and --iteration-marker are mutually exclusive")
+    if (args.range is not None or args.iteration_marker is not None) and \
+            (args.start is not None or args.end is not None):
+        parser.error("--start/--end cannot be combined with --range or --iteration-marker")
+    if args.start is not None and args.end is not None and args.start > args.end:
+        parser.error("--start must not be after --end")
+    if args.occurrence is not None and args.range is None:
+        parser.error("--occurrence requires --range")
+    if args.iterations is not None and args.iteration_marker is None:
+        parser.error("--iterations requires --iteration-marker")
+    if os.path.exists(args.output):
+        parser.error("output {} already exists".format(args.output))
+
+    # The source database is only ever read; everything is written to a
+    # fresh output database with INSERT ... SELECT.
+    conn = sqlite3.connect(file_uri(args.filename, "ro"), uri=True)
+    conn.row_factory = sqlite3.Row
+
+    if args.range is not None:
+        occurrence = args.occurrence if args.occurrence is not None else 0
+        start, end = range_window(conn, args.range, occurrence)
+    elif args.iteration_marker is not None:
+        first, last = args.iterations if args.iterations is not None else (0, 0)
+        start, end = iteration_window(conn, args.iteration_marker, first, last)
+    elif args.start is not None or args.end is not None:
+        start, end = args.start, args.end
+    else:
+        parser.error("one of --start/--end, --range or --iteration-marker is required")
+    eprint("Keeping data from {} to {}".format(
+        "beginning" if start is None else start,
+        "end" if end is None else end))
+    conn.close()
+
+    try:
+        slice_db(args.filename, args.output, start, end)
+    except BaseException:
+        if os.path.exists(args.output):
+            os.remove(args.output)
+        raise
+
+def iteration_span(value):
+    """Parse a FIRST[:LAST] argument into a (first, last) pair."""
+    first, _, last = value.partition(":")
+    try:
+        first = int(first)
+        last = int(last) if last else first
+    except ValueError:
+        raise argparse.ArgumentTypeError("expected FIRST[:LAST], got {!r}".format(value))
+    return first, last
+
+def file_uri(filename, mode):
+    """SQLite URI which opens filename with the given mode (ro, rwc, ...).
+    The path is escaped, so it is never itself parsed as a URI."""
+    return "file:{}?mode={}".format(urllib.parse.quote(os.path.abspath(filename)), mode)
+
+def range_window(conn, name, occurrence):
+    """Return the (start, end) timestamps of an occurrence of an NVTX range."""
+    ranges = [(r["start_time"], r["end_time"]) for r in find_markers(conn, name)
+              if r["end_time"] is not None]
+    if not 0 <= occurrence < len(ranges):
+        sys.exit("NVTX range {!r} has {} occurrences, cannot select occurrence {}".format(
+            name, len(ranges), occurrence))
+    return ranges[occurrence]
+
+def iteration_window(conn, name, first, last):
+    """Return the (start, end) timestamps covering iterations first..last,
+    where every occurrence of the NVTX marker name starts a new iteration.
+    The last iteration extends to the end of the profile."""
+    starts = [r["start_time"] for r in find_markers(conn, name)]
+    if not 0 <= first <= last < len(starts):
+        sys.exit("NVTX marker {!r} has {} occurrences, cannot select iterations {}:{}".format(
+            name, len(starts), first, last))
+    if last + 1 < len(starts):
+        # Rows starting exactly at the next marker belong to the next
+        # iteration.
+        return starts[first], starts[last + 1] - 1
+    return starts[first], None
+
+def find_markers(conn, name):
+    """Return the start and end timestamps of every NVTX marker or range
+    called name, ordered by start time.  end_time is None for
+    instantaneous markers."""
+    return conn.execute(" ".join([
+            "SELECT",
+            ",".join([
+                "start.timestamp AS start_time",
+                "end.timestamp AS end_time"
+            ]),
+            "FROM",
+            "(SELECT * FROM CUPTI_ACTIVITY_KIND_MARKER WHERE name IN",
+            "(SELECT _id_ FROM StringTable WHERE value = ?)) AS start",
+            "LEFT JOIN",
+            "(SELECT * FROM CUPTI_ACTIVITY_KIND_MARKER WHERE name = 0) AS end",
+            "ON start.id = end.id",
+            "ORDER BY start.timestamp"]), (name,)).fetchall()
+
+# CPU-side API calls.  These are the only activity rows selected by time;
+# GPU work and per-activity records follow them by correlationId.
+API_TABLES = ["CUPTI_ACTIVITY_KIND_RUNTIME", "CUPTI_ACTIVITY_KIND_DRIVER"]
+
+def slice_db(filename, output, start, end):
+    """Copy the rows of filename inside [start, end] into a new database
+    output.  A bound of None means unbounded.
+
+    API calls are kept if they start inside the window; kernels, copies
+    and the metrics, events etc. recorded for them are kept if they were
+    launched by a kept API call, wherever they ran."""
+    conn = sqlite3.connect(file_uri(output, "rwc"), uri=True)
     conn.row_factory = sqlite3.Row
+    # The output is scratch until we are done; on failure it is deleted.
+    conn.execute("PRAGMA journal_mode = OFF")
+    conn.execute("PRAGMA synchronous = OFF")
+    conn.execute("ATTACH DATABASE ? AS src", (file_uri(filename, "ro"),))
+
+    schema = conn.execute("SELECT type, name, sql FROM src.sqlite_master WHERE sql IS NOT NULL").fetchall()
+    tables = [r for r in schema if r["type"] == "table" and not r["name"].startswith("sqlite_")]
+    for r in tables:
+        conn.execute(r["sql"])
+
+    def window(column):
+        clauses = []
+        params = []
+        if start is not None:
+            clauses.append("{} >= ?".format(column))
+            params.append(start)
+        if end is not None:
+            clauses.append("{} <= ?".format(column))
+            params.append(end)
+        return " AND ".join(clauses) or "1", params
+
+    # Markers are kept or dropped as a whole (start and end rows together),
+    # keyed on the marker id, so that ranges are never split.
+    conn.execute("CREATE TEMP TABLE marker_ids (id INTEGER PRIMARY KEY)")
+    if "CUPTI_ACTIVITY_KIND_MARKER" in set(r["name"] for r in tables):
+        where, params = window("timestamp")
+        conn.execute("INSERT OR IGNORE INTO marker_ids SELECT id FROM src.CUPTI_ACTIVITY_KIND_MARKER "
+                     "WHERE name != 0 AND {}".format(where), params)
+
+    # GPU activity launched inside the window usually runs after it, so it
+    # is matched to the API calls that launched it rather than by time.
+    conn.execute("CREATE TEMP TABLE correlation_ids (id INTEGER PRIMARY KEY)")
+    for r in tables:
+        if r["name"] in API_TABLES:
+            where, params = window("start")
+            conn.execute("INSERT OR IGNORE INTO correlation_ids SELECT correlationId FROM src.{} "
+                         "WHERE {}".format(r["name"], where), params)
+
+    for r in tables:
+        table = r["name"]
+        columns = set(c["name"] for c in conn.execute("PRAGMA src.table_info({})".format(table)))
+        if table in ("CUPTI_ACTIVITY_KIND_MARKER", "CUPTI_ACTIVITY_KIND_MARKER_DATA"):
+            where, params = "id IN (SELECT id FROM marker_ids)", []
+        elif table in API_TABLES:
+            where, params = window("start")
+        elif "correlationId" in columns:
+            where, params = "correlationId IN (SELECT id FROM correlation_ids)", []
+        elif "start" in columns:
+            where, params = window("start")
+        elif "timestamp" in columns:
+            where, params = window("timestamp")
+        else:
+            # StringTable, DEVICE, CONTEXT, FUNCTION, SOURCE_LOCATOR, NAME
+            # etc. are lookup tables referenced by id from the activity
+            # tables, so keep all of them.
+            where, params = "1", []
+        n = conn.execute("INSERT INTO main.{0} SELECT * FROM src.{0} WHERE {1}".format(table, where),
+                         params).rowcount
+        eprint("{}: {} rows".format(table, n))
 
-    print("Candidates:")
-    last = float("Inf")
-    for r in conn.execute("SELECT end FROM CUPTI_ACTIVITY_KIND_OVERHEAD ORDER BY end DESC LIMIT 10"):
-        print(" * {}".format(r["end"]))
-    # 3 is a magic number
-    cutoff = conn.execute("SELECT end as max FROM CUPTI_ACTIVITY_KIND_OVERHEAD ORDER BY end DESC LIMIT 1 OFFSET 3").fetchone()["max"]
-    print("Deleting all data before {}".format(cutoff))
-    for table in ["CUPTI_ACTIVITY_KIND_RUNTIME", "CUPTI_ACTIVITY_KIND_DRIVER", "CUPTI_ACTIVITY_KIND_MEMCPY", "CUPTI_ACTIVITY_KIND_MEMSET", "CUPTI_ACTIVITY_KIND_CONCURRENT_KERNEL", "CUPTI_ACTIVITY_KIND_OVERHEAD"]:
-        conn.execute("DELETE FROM {} WHERE start <= ?".format(table), (cutoff ,))
+    # Build indexes after the bulk copy, which is cheaper than maintaining
+    # them row by row.
+    for r in schema:
+        if r["type"] in ("index", "view", "trigger"):
+            conn.execute(r["sql"])
 
     conn.commit()
+    conn.execute("DETACH DATABASE src")
+    conn.execute("VACUUM")
     conn.close()
 
 def eprintRow(row):